@@ -88,7 +88,9 @@ void setup() {
             return;
         }
 
-        String json = "{";
+        String json;
+        json.reserve(96);
+        json += "{";
         json += "\"temp\": " + String(tempC) + ",";
         json += "\"humidity\": " + String(humidity) + ",";
         json += "\"pressure\": " + String(pressure) + ",";